@@ -1,5 +1,7 @@
 from typing import List
 
+import numpy as np
+
 
 def addition_matrices(
     matrix1: List[List[float]], matrix2: List[List[float]]
@@ -14,14 +16,14 @@ def addition_matrices(
     Returns:
         Optional[List[List[float]]]: Sum of matrix a and matrix b
     """
-    if not matrix1 or not matrix1[0] or not matrix2 or not matrix2[0]:
+    a = np.array(matrix1, dtype=np.float64)
+    b = np.asarray(matrix2)
+    if a.size == 0 or b.size == 0:
         raise ValueError("Matrices must not be empty")
 
-    if len(matrix1) == len(matrix2) and (len(matrix1[0]) == len(matrix2[0])):
-        return [
-            [matrix1[i][j] + matrix2[i][j] for j in range(len(matrix1[0]))]
-            for i in range(len(matrix1))
-        ]
+    if a.shape == b.shape:
+        # a is a private copy, so the sum can be written into it in place
+        return np.add(a, b, out=a).tolist()
     raise ValueError("Matrices must have same dimensions")
 
 
@@ -38,15 +40,14 @@ def multiplication_matrices(
     Returns:
         Optional[List[List[float]]]: Product of matrix a and matrix b
     """
-    if len(matrix1[0]) == len(matrix2):
-        return [
-            [
-                sum(matrix1[i][k] * matrix2[k][j] for k in range(len(matrix1[0])))
-                for j in range(len(matrix2[0]))
-            ]
-            for i in range(len(matrix1))
-        ]
-    raise ValueError("Matrices must have correct dimensions")
+    # check the shapes before paying for the conversion of both operands
+    if len(matrix1[0]) != len(matrix2):
+        raise ValueError("Matrices must have correct dimensions")
+
+    # contiguous float64 operands let @ go straight to BLAS dgemm
+    a = np.ascontiguousarray(matrix1, dtype=np.float64)
+    b = np.ascontiguousarray(matrix2, dtype=np.float64)
+    return (a @ b).tolist()
 
 
 def transpose(matrix1: List[List[float]]) -> List[List[float]]:
@@ -59,8 +60,6 @@ def transpose(matrix1: List[List[float]]) -> List[List[float]]:
     Returns:
         Optional[List[List[float]]]: Transposed matrix
     """
-    if not matrix1:
-        return []
-    return [
-        [matrix1[j][i] for j in range(len(matrix1))] for i in range(len(matrix1[0]))
-    ]
+    # zip(*rows) gathers each column in C; for list input this beats a round
+    # trip through an ndarray, which must box every element again in tolist()
+    return list(map(list, zip(*matrix1)))
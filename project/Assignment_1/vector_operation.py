@@ -1,6 +1,8 @@
-from math import acos, pi
+from math import acos, degrees, sqrt
 from typing import List, Optional
 
+import numpy as np
+
 
 def scalar_multiplication_of_vectors(
     vector1: List[float], vector2: List[float]
@@ -15,8 +17,10 @@ def scalar_multiplication_of_vectors(
     Returns:
         Optional[float]: Scalar product of vectors vector1 and vector2
     """
-    if len(vector1) == len(vector2):
-        return sum([vector1[i] * vector2[i] for i in range(len(vector1))])
+    a = np.asarray(vector1, dtype=np.float64)
+    b = np.asarray(vector2, dtype=np.float64)
+    if a.shape == b.shape:
+        return float(a @ b)
     raise ValueError("Vectors must have same dimensions")
 
 
@@ -30,7 +34,7 @@ def find_length_of_vectors(vector1: List[float]) -> float:
     Returns:
         float: Length of vector
     """
-    return sum([vector1[i] ** 2 for i in range(len(vector1))]) ** 0.5
+    return float(np.linalg.norm(np.asarray(vector1, dtype=np.float64)))
 
 
 def get_angle_between_vectors(vector1: List[float], vector2: List[float]) -> float:
@@ -42,16 +46,19 @@ def get_angle_between_vectors(vector1: List[float], vector2: List[float]) -> flo
         vector2 (List[float]): Second vector
 
     Returns:
-        Optional[float]: Angle between vectors in radians
+        Optional[float]: Angle between vectors in degrees
     """
     if len(vector1) != len(vector2):
         raise ValueError("Vectors sizes must be equal")
 
-    return (
-        180
-        * acos(
-            scalar_multiplication_of_vectors(vector1, vector2)
-            / (find_length_of_vectors(vector1) * find_length_of_vectors(vector2))
-        )
-        / pi
-    )
+    # convert once and take all three dot products from the same arrays
+    a = np.asarray(vector1, dtype=np.float64)
+    b = np.asarray(vector2, dtype=np.float64)
+    dot = float(a @ b)
+    # root each squared norm before multiplying, so the product of two squared
+    # norms cannot overflow or underflow where the lengths themselves do not
+    norms = sqrt(a @ a) * sqrt(b @ b)
+
+    # rounding can push the cosine of (anti)parallel vectors just past +-1
+    cos_angle = max(-1.0, min(1.0, dot / norms))
+    return degrees(acos(cos_angle))
@@ -1,6 +1,22 @@
-from functools import reduce
-from typing import Callable, Iterable, Generator, Any, Sequence
-import random
+from functools import partial, reduce
+from itertools import islice
+from typing import Callable, Iterable, Iterator, Generator, Any, Optional, Sequence
+
+import numpy as np
+
+# generator behind generate_data; replace it through seed() for repeatable data
+_rng: np.random.Generator = np.random.default_rng()
+_BATCH_SIZE = 8192
+
+
+def seed(value: Optional[int] = None) -> None:
+    """
+    Reseed the random number generator used by generate_data
+    Args:
+        value (Optional[int]): The seed; None draws fresh entropy from the OS.
+    """
+    global _rng
+    _rng = np.random.default_rng(value)
 
 
 def generate_data(count: int, min_val: int, max_val: int) -> Generator[int, None, None]:
@@ -13,13 +29,14 @@ def generate_data(count: int, min_val: int, max_val: int) -> Generator[int, None
     Yields:
         int: Random integers within the specified range, one at a time.
     """
-    for _ in range(count):
-        yield random.randint(min_val, max_val)
+    for start in range(0, count, _BATCH_SIZE):
+        size = min(_BATCH_SIZE, count - start)
+        yield from _rng.integers(min_val, max_val, size=size, endpoint=True).tolist()
 
 
 def create_op_adapter(
     func: Callable, *args: Any, **kwargs: Any
-) -> Callable[[Iterable[Any]], Generator[Any, None, None]]:
+) -> Callable[[Iterable[Any]], Iterator[Any]]:
     """
     This adapter standardizes the application of functions such as map, filter,
     zip, enumerate, reduce, or any custom function
@@ -28,9 +45,31 @@ def create_op_adapter(
         *args Positional arguments for the `func`.
         **kwargs Keyword arguments for the `func`.
     Returns:
-        Callable[[Iterable[Any]], Generator[Any, None, None]]:
+        Callable[[Iterable[Any]], Iterator[Any]]:
         A function that takes an iterable input, applies `func` with given arguments,
     """
+    # map and filter are returned as partials of the builtins themselves, so a
+    # chain of them in `pipeline` passes each element through in C instead of
+    # resuming a generator frame per stage.
+    if func is map or func is filter:
+        return partial(func, args[0])
+
+    # Pick the concrete operation once, when the adapter is built, so the
+    # returned generator does not re-check the kind of `func` on every call.
+    operation: Callable[[Iterable[Any]], Iterable[Any]]
+    if func is zip:
+        operation = lambda it: zip(it, *args)
+    elif func is enumerate:
+        operation = lambda it: enumerate(it, *args, **kwargs)
+    elif func is reduce:
+        reduction_func = args[0] if args else func
+        initial = args[1] if len(args) > 1 else kwargs.get("initializer", None)
+        if initial is not None:
+            operation = lambda it: (reduce(reduction_func, it, initial),)
+        else:
+            operation = lambda it: (reduce(reduction_func, it),)
+    else:
+        operation = lambda it: func(it, *args, **kwargs)
 
     def apply_adapted_op(input_iterable: Iterable[Any]) -> Generator[Any, None, None]:
         """
@@ -40,39 +79,14 @@ def create_op_adapter(
         Yields:
             Processed items as per the adapted function's behavior.
         """
-        if func is map:
-            yield from map(args[0], input_iterable)
-        elif func is filter:
-            yield from filter(args[0], input_iterable)
-        elif func is zip:
-            yield from zip(input_iterable, *args)
-        elif func is enumerate:
-            yield from enumerate(input_iterable, *args, **kwargs)
-        elif func is reduce:
-            if args:
-                reduction_func = args[0]
-            else:
-                reduction_func = func
-
-            if len(args) > 1:
-                initial = args[1]
-            else:
-                initial = kwargs.get("initializer", None)
-
-            if initial is not None:
-                result = reduce(reduction_func, input_iterable, initial)
-            else:
-                result = reduce(reduction_func, input_iterable)
-            yield result
-        else:
-            yield from func(input_iterable, *args, **kwargs)
+        yield from operation(input_iterable)
 
     return apply_adapted_op
 
 
 def pipeline(
     source_data: Iterable[Any],
-    *operations: Callable[[Iterable[Any]], Generator[Any, None, None]]
+    *operations: Callable[[Iterable[Any]], Iterator[Any]],
 ) -> Generator[Any, None, None]:
     """
     Apply a sequence of operations to the source data
@@ -82,12 +96,51 @@ def pipeline(
     Yields:
         Any: Processed items after applying all operations in sequence.
     """
-    stream = source_data
+    stream: Iterable[Any] = source_data
     for operation in operations:
         stream = operation(stream)
     yield from stream
 
 
+def numpy_pipeline(
+    source_data: Iterable[float],
+    *operations: Callable[[np.ndarray], np.ndarray],
+    batch_size: int = _BATCH_SIZE,
+) -> Generator[float, None, None]:
+    """
+    Apply a sequence of vectorized operations to numeric data in batches
+    Args:
+        source_data (Iterable[float]): The initial numeric stream or iterable.
+        *operations (Callable): Functions that take and return a NumPy array.
+        batch_size (int, optional): Number of items collected per batch.
+    Returns:
+        Generator[float, None, None]: Processed items after applying all
+            operations in sequence.
+    Raises:
+        ValueError: If batch_size is less than 1.
+    """
+    # validated here rather than in the generator, so the error is raised at
+    # call time instead of on the first next()
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+    return _process_batches(iter(source_data), operations, batch_size)
+
+
+def _process_batches(
+    iterator: Iterator[float],
+    operations: Sequence[Callable[[np.ndarray], np.ndarray]],
+    batch_size: int,
+) -> Generator[float, None, None]:
+    """Yields items of the iterator processed batch by batch by the operations."""
+    while True:
+        batch = np.fromiter(islice(iterator, batch_size), dtype=np.float64)
+        if batch.size == 0:
+            return
+        for operation in operations:
+            batch = operation(batch)
+        yield from batch.tolist()
+
+
 def aggregator(source_data: Iterable[Any], output_type: Callable = list) -> Sequence:
     """
     Aggregate all items from a source iterable into a collection of specified type
@@ -1,6 +1,78 @@
 import copy
 import inspect
-from typing import Callable, Any
+import pickle
+from typing import Any, Callable, List, Tuple
+
+
+# Values of these exact types cannot be mutated, so isolating them is a no-op.
+# Tuples and frozensets are left out: they may still hold mutable items.
+_IMMUTABLE_TYPES = frozenset({int, float, complex, bool, str, bytes, type(None)})
+
+# Builtin containers holding only immutable scalars are copied with a pickle
+# round trip, which walks the object graph in C and is several times faster
+# than copy.deepcopy.
+_PICKLE_COPY_TYPES = frozenset({list, dict, tuple, set, frozenset})
+
+
+def _is_plain_data(value: Any) -> bool:
+    """
+    Checks that the value is built only from builtin containers and immutable
+    scalars, so pickling it copies exactly what deepcopy would.
+    """
+    stack = [value]
+    seen = set()
+    while stack:
+        item = stack.pop()
+        item_type = type(item)
+        if item_type in _IMMUTABLE_TYPES:
+            continue
+        if item_type not in _PICKLE_COPY_TYPES:
+            return False
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        if item_type is dict:
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        else:
+            stack.extend(item)
+    return True
+
+
+def _copy_isolated(value: Any) -> Any:
+    """Returns a deep copy of the value, skipping the copy for immutable ones."""
+    if type(value) in _IMMUTABLE_TYPES:
+        return value
+    if _is_plain_data(value):
+        try:
+            return pickle.loads(pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+        except (pickle.PicklingError, TypeError, AttributeError):
+            pass
+    return copy.deepcopy(value)
+
+
+class _Curried:
+    """
+    Internal partial application of a curried function.
+    Each call returns a new stage holding one more argument, so a stage can be
+    applied again; the function runs once all arguments are given.
+    """
+
+    __slots__ = ("function", "arity", "args")
+
+    def __init__(self, function: Callable, arity: int, args: Tuple[Any, ...]) -> None:
+        self.function = function
+        self.arity = arity
+        self.args = args
+
+    def __call__(self, *next_args: Any) -> Any:
+        if len(next_args) != 1:
+            raise ValueError("Curried function only accepts 1 argument at a time")
+        args = self.args + next_args
+
+        if len(args) == self.arity:
+            return self.function(*args)
+        return _Curried(self.function, self.arity, args)
 
 
 def curry_explicit(function: Callable, arity: int) -> Callable:
@@ -29,26 +101,9 @@ def curry_explicit(function: Callable, arity: int) -> Callable:
                 f"Curried function only accepts 1 argument at a time, got {len(args)}"
             )
 
-        collected: list[Any] = list(args)
-
-        def collector(*next_args: Any) -> Any:
-            if len(next_args) != 1:
-                raise ValueError("Curried function only accepts 1 argument at a time")
-            collected.append(next_args[0])
-
-            if len(collected) == arity:
-                return function(*collected)
-            elif len(collected) < arity:
-                return collector
-            else:
-                raise ValueError(
-                    f"Too many arguments: expected {arity}, got {len(collected)}"
-                )
-
         if arity == 1:
-            return function(collected[0])
-        else:
-            return collector
+            return function(args[0])
+        return _Curried(function, arity, args)
 
     return curried
 
@@ -143,6 +198,12 @@ def smart_args(func: Callable) -> Callable:
     Supports keyword-only arguments.
     """
     sig = inspect.signature(func)
+
+    # Sort the parameters by kind of default once, so that a call only walks
+    # these prebuilt lists instead of re-inspecting the signature.
+    evaluated: List[Tuple[str, _EvaluatedWrapper]] = []
+    isolated: List[str] = []
+    plain: List[Tuple[str, Any]] = []
     for param_name, param in sig.parameters.items():
         default: Any = param.default
 
@@ -151,37 +212,41 @@ def smart_args(func: Callable) -> Callable:
                 raise AssertionError(
                     f"Parameter '{param_name}' with Evaluated/Isolated must be keyword-only "
                 )
+            if isinstance(default, _EvaluatedWrapper):
+                evaluated.append((param_name, default))
+            else:
+                isolated.append(param_name)
+        else:
+            plain.append((param_name, default))
+    has_smart_defaults = bool(evaluated or isolated)
 
     def wrapper(*args: Any, **kwargs: Any) -> Any:
-        if args:
-            for param_name, param in sig.parameters.items():
-                if isinstance(param.default, (_EvaluatedWrapper, _IsolatedWrapper)):
-                    raise AssertionError(
-                        "Positional arguments are not allowed for functions "
-                        "with Evaluated/Isolated parameters"
-                    )
+        if args and has_smart_defaults:
+            raise AssertionError(
+                "Positional arguments are not allowed for functions "
+                "with Evaluated/Isolated parameters"
+            )
 
         processed_kwargs = {}
 
-        for param_name, param in sig.parameters.items():
-            default: Any = param.default
-
+        for param_name, default in plain:
             if param_name in kwargs:
-                value: Any = kwargs[param_name]
+                processed_kwargs[param_name] = kwargs[param_name]
+            elif default is not inspect.Parameter.empty:
+                processed_kwargs[param_name] = default
+
+        for param_name in isolated:
+            if param_name not in kwargs:
+                raise TypeError(
+                    f"Parameter '{param_name}' with Isolated() requires a value to be passed"
+                )
+            processed_kwargs[param_name] = _copy_isolated(kwargs[param_name])
 
-                if isinstance(default, _IsolatedWrapper):
-                    processed_kwargs[param_name] = copy.deepcopy(value)
-                else:
-                    processed_kwargs[param_name] = value
+        for param_name, evaluated_default in evaluated:
+            if param_name in kwargs:
+                processed_kwargs[param_name] = kwargs[param_name]
             else:
-                if isinstance(default, _EvaluatedWrapper):
-                    processed_kwargs[param_name] = default.get_value()
-                elif isinstance(default, _IsolatedWrapper):
-                    raise TypeError(
-                        f"Parameter '{param_name}' with Isolated() requires a value to be passed"
-                    )
-                elif default != inspect.Parameter.empty:
-                    processed_kwargs[param_name] = default
+                processed_kwargs[param_name] = evaluated_default.get_value()
 
         return func(*args, **processed_kwargs)
 
@@ -1,5 +1,9 @@
-from typing import List, Optional
-from .dice import Dice
+from operator import itemgetter
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .dice import roll_values
 from .player import Player
 from .scoreboard import Scoreboard, Category
 
@@ -7,6 +11,8 @@ from .scoreboard import Scoreboard, Category
 class Turn:
     """Manages a single turn for a player in Yahtzee."""
 
+    __slots__ = ("player", "dice", "roll_count", "current_values", "_all_indices")
+
     def __init__(self, player: Player, num_dice: int = 5) -> None:
         """
         Initializes a turn for the specified player.
@@ -16,11 +22,18 @@ class Turn:
             num_dice: The number of dice in the game.
         """
         self.player: Player = player
-        self.dice: List[Dice] = [Dice() for _ in range(num_dice)]
+        # face values of all dice in one array rather than a list of Dice objects
+        self.dice: np.ndarray = roll_values(num_dice)
         self.roll_count: int = 0
         self.current_values: List[int] = []
+        self._all_indices: range = range(num_dice)
+
+    def reset(self) -> None:
+        """Prepares the turn to be played again, reusing its dice array."""
+        self.roll_count = 0
+        self.current_values = []
 
-    def roll_dice(self, indices_to_roll: Optional[List[int]] = None) -> List[int]:
+    def roll_dice(self, indices_to_roll: Optional[Sequence[int]] = None) -> List[int]:
         """
         Rolls the specified dice and updates their values.
 
@@ -34,11 +47,11 @@ class Turn:
         if self.roll_count >= 3:
             raise ValueError("Max rolls exceeded")
         if indices_to_roll is None:
-            indices_to_roll = list(range(len(self.dice)))
-        for i in indices_to_roll:
-            if 0 <= i < len(self.dice):
-                self.dice[i].roll()
-        self.current_values = [d.value for d in self.dice]
+            indices_to_roll = self._all_indices
+        to_roll = [i for i in indices_to_roll if 0 <= i < len(self.dice)]
+        # one generator call for all rolled dice instead of one randint per die
+        self.dice[to_roll] = roll_values(len(to_roll))
+        self.current_values = self.dice.tolist()
         self.roll_count += 1
         return self.current_values
 
@@ -82,6 +95,8 @@ class Turn:
 class GameState:
     """Tracks the current state of the Yahtzee game."""
 
+    __slots__ = ("players", "max_rounds", "current_round", "current_player_index")
+
     def __init__(self, players: List[Player]) -> None:
         """
         Initializes the game state.
@@ -122,15 +137,17 @@ class GameState:
     def __str__(self) -> str:
         """Returns a string representation of the current game state."""
         leaderboard = sorted(
-            self.players, key=lambda p: p.get_total_score(), reverse=True
+            ((p, p.get_total_score()) for p in self.players),
+            key=itemgetter(1),
+            reverse=True,
         )
         lines = [
             f"\n{'=' * 20} ROUND {self.current_round + 1}/{self.max_rounds} {'=' * 20}",
             f"Current Player: {self.get_current_player().name}",
             "Leaderboard:",
         ]
-        for p in leaderboard:
-            lines.append(f"  - {p.name}: {p.get_total_score()} points")
+        for p, score in leaderboard:
+            lines.append(f"  - {p.name}: {score} points")
         return "\n".join(lines)
 
 
@@ -152,6 +169,8 @@ class YahtzeeGame:
         self.state: GameState = GameState(players)
         self.verbose: bool = verbose
         self.winner: Optional[Player] = None
+        # one Turn per player, reset and reused on each of their turns
+        self._turns: Dict[Player, Turn] = {p: Turn(p) for p in players}
 
     def get_game_state(self) -> GameState:
         """
@@ -169,7 +188,10 @@ class YahtzeeGame:
         Args:
             player: The player taking the turn.
         """
-        turn = Turn(player)
+        turn = self._turns.get(player)
+        if turn is None:
+            turn = self._turns[player] = Turn(player)
+        turn.reset()
         if self.verbose:
             print(f"\n--- {player.name}'s turn ---")
 
@@ -202,7 +224,7 @@ class YahtzeeGame:
         """Plays a complete game of Yahtzee from start to finish."""
         if self.verbose:
             print("\n" + "=" * 50 + "\nYAHTZEE GAME START\n" + "=" * 50)
-            print(f"Players: {', '.join(str(p) for p in self.state.players)}")
+            print(f"Players: {', '.join([str(p) for p in self.state.players])}")
 
         while not self.state.is_game_over():
             if self.verbose:
@@ -217,26 +239,32 @@ class YahtzeeGame:
 
     def _determine_winner(self) -> None:
         """Determines the winner(s) at the end of the game."""
-        if not self.state.players:
-            return
-        max_score = max(p.get_total_score() for p in self.state.players)
-        winners = [p for p in self.state.players if p.get_total_score() == max_score]
-        self.winner = winners[0] if len(winners) == 1 else None
+        best_player: Optional[Player] = None
+        best_score = 0
+        ties = 0
+        for player in self.state.players:
+            score = player.get_total_score()
+            if best_player is None or score > best_score:
+                best_player, best_score, ties = player, score, 1
+            elif score == best_score:
+                ties += 1
+        self.winner = best_player if ties == 1 else None
 
     def print_final_results(self) -> None:
         """Prints the final game results and scoreboard."""
         print("\n" + "=" * 50 + "\nGAME OVER - FINAL RESULTS\n" + "=" * 50)
         leaderboard = sorted(
-            self.state.players, key=lambda p: p.get_total_score(), reverse=True
+            ((p, p.get_total_score()) for p in self.state.players),
+            key=itemgetter(1),
+            reverse=True,
         )
 
-        all_scores = [p.get_total_score() for p in self.state.players]
+        all_scores = [score for _, score in leaderboard]
         average_score = sum(all_scores) / len(all_scores) if all_scores else 0
 
         print(f"Average score for the game: {average_score:.2f}\n")
 
-        for i, player in enumerate(leaderboard, 1):
-            score = player.get_total_score()
+        for i, (player, score) in enumerate(leaderboard, 1):
             win_loss = score - average_score
             sign = "+" if win_loss >= 0 else ""
             print(
@@ -247,6 +275,6 @@ class YahtzeeGame:
         if self.winner:
             print(f"\n WINNER: {self.winner.name}! ")
         else:
-            top_score = leaderboard[0].get_total_score()
-            winners = [p.name for p in leaderboard if p.get_total_score() == top_score]
+            top_score = leaderboard[0][1]
+            winners = [p.name for p, score in leaderboard if score == top_score]
             print(f"\n TIE between: {', '.join(winners)}")
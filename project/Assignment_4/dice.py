@@ -1,16 +1,62 @@
-import random
+from typing import List, Optional
+
+import numpy as np
+
+# shared by every roll in the game; replace it through seed() for repeatable games
+_rng: np.random.Generator = np.random.default_rng()
+# single die rolls are served from a buffer refilled with one RNG call
+_ROLL_BUFFER_SIZE = 1024
+_roll_buffer: List[int] = []
+
+
+def seed(value: Optional[int] = None) -> None:
+    """
+    Reseeds the generator used for all dice rolls.
+
+    Args:
+        value: The seed; None draws fresh entropy from the OS.
+    """
+    global _rng
+    _rng = np.random.default_rng(value)
+    # drop rolls drawn from the old generator so reseeding is repeatable
+    _roll_buffer.clear()
+
+
+def roll_values(count: int) -> np.ndarray:
+    """
+    Rolls several six-sided dice at once.
+
+    Args:
+        count: The number of dice to roll.
+    Returns:
+        An int8 array with a random value between 1 and 6 for each die.
+    """
+    return _rng.integers(1, 7, size=count, dtype=np.int8)
+
+
+def _next_roll() -> int:
+    """Returns one die roll, refilling the roll buffer when it runs out."""
+    # pop first and refill on IndexError: checking for an empty buffer before
+    # popping would let another thread empty it in between
+    while True:
+        try:
+            return _roll_buffer.pop()
+        except IndexError:
+            _roll_buffer.extend(_rng.integers(1, 7, size=_ROLL_BUFFER_SIZE).tolist())
 
 
 class Dice:
     """Represents a single six-sided die."""
 
+    __slots__ = ("value",)
+
     def __init__(self) -> None:
         """Initializes the die with a random value between 1 and 6."""
-        self.value: int = random.randint(1, 6)
+        self.value: int = _next_roll()
 
     def roll(self) -> None:
         """Rolls the die and updates its value to a new random number."""
-        self.value = random.randint(1, 6)
+        self.value = _next_roll()
 
     def __str__(self) -> str:
         """Returns the string representation of the die's current value."""
@@ -1,12 +1,53 @@
 import random
-from typing import List
-from collections import Counter
-from .scoreboard import Scoreboard, Category, DiceValue, CombinationThreshold
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Tuple
+from .scoreboard import Scoreboard, Category, CombinationThreshold
+
+# Category lookups used by the bots, built once at import instead of per call
+_VALUE_MAP: Dict[int, Category] = {
+    v: c for c, v in Scoreboard.STAGE_ONE_TARGETS.items()
+}
+_MULTI_KIND_CATEGORIES: FrozenSet[Category] = frozenset(
+    {
+        Category.PAIR,
+        Category.TWO_PAIRS,
+        Category.THREE_OF_A_KIND,
+        Category.FOUR_OF_A_KIND,
+        Category.FULL_HOUSE,
+        Category.POKER,
+        Category.CHANCE,
+    }
+)
+
+
+@lru_cache(maxsize=None)
+def _cached_scores(dice_key: Tuple[int, ...]) -> Dict[Category, int]:
+    """
+    Scores sorted dice values for every category, memoized across calls.
+    Scores do not depend on dice order, so there are only 252 distinct keys.
+    """
+    return Scoreboard.score_all_categories(list(dice_key))
+
+
+@lru_cache(maxsize=1 << 16)
+def _best_category(
+    dice_key: Tuple[int, ...], available: Tuple[Category, ...]
+) -> Category:
+    """
+    Picks the highest scoring available category for sorted dice values.
+    Memoized on the (dice, available categories) position, which repeats
+    across turns, players and games.
+    """
+    scores = _cached_scores(dice_key)
+    # max keeps the first of equally scored categories, as the old loop did
+    return max(available, key=scores.__getitem__)
 
 
 class Player:
     """Base class for all player types in the Yahtzee game."""
 
+    __slots__ = ("name", "scoreboard")
+
     def __init__(self, name: str) -> None:
         """
         Initializes a player with a name and empty scoreboard.
@@ -54,32 +95,17 @@ class Player:
         Returns:
             List of indices of dice to reroll.
         """
-        counts = Counter(dice_values)
-        target_map = {
-            Category.ONES: DiceValue.ONE.value,
-            Category.TWOS: DiceValue.TWO.value,
-            Category.THREES: DiceValue.THREE.value,
-            Category.FOURS: DiceValue.FOUR.value,
-            Category.FIVES: DiceValue.FIVE.value,
-            Category.SIXES: DiceValue.SIX.value,
-        }
-
-        if goal_category in target_map:
-            target_value = target_map[goal_category]
+        if goal_category in Scoreboard.STAGE_ONE_TARGETS:
+            target_value = Scoreboard.STAGE_ONE_TARGETS[goal_category]
             return [i for i, v in enumerate(dice_values) if v != target_value]
 
-        if goal_category in [
-            Category.PAIR,
-            Category.TWO_PAIRS,
-            Category.THREE_OF_A_KIND,
-            Category.FOUR_OF_A_KIND,
-            Category.FULL_HOUSE,
-            Category.POKER,
-            Category.CHANCE,
-        ]:
+        if goal_category in _MULTI_KIND_CATEGORIES:
             if not dice_values:
                 return []
-            target_value = counts.most_common(1)[0][0]
+            # max over dice_values keeps Counter.most_common's first-seen order
+            # on ties
+            tally = Scoreboard.count_faces(dice_values)
+            target_value = max(dice_values, key=tally.__getitem__)
             return [i for i, v in enumerate(dice_values) if v != target_value]
 
         return []
@@ -92,6 +118,8 @@ class Player:
 class AggressiveBot(Player):
     """Bot that selects the category with the maximum potential score."""
 
+    __slots__ = ()
+
     def decide_turn_goal(self, dice_values: List[int]) -> Category:
         """
         Chooses the available category with the highest potential score.
@@ -100,17 +128,9 @@ class AggressiveBot(Player):
         Returns:
             The category with maximum potential score.
         """
-        available = self.scoreboard.get_available_categories()
-        best_category = None
-        max_potential_score = float("-inf")
-
-        for category in available:
-            potential_score = Scoreboard.score_for_category(category, dice_values)
-            if potential_score > max_potential_score:
-                max_potential_score = potential_score
-                best_category = category
-
-        return best_category if best_category else available[0]
+        return _best_category(
+            tuple(sorted(dice_values)), self.scoreboard.get_available_categories()
+        )
 
     def make_reroll_decision(
         self, dice_values: List[int], goal_category: Category
@@ -122,6 +142,8 @@ class AggressiveBot(Player):
 class CautiousBot(Player):
     """Bot that prioritizes safe scoring options and stage one categories."""
 
+    __slots__ = ()
+
     def decide_turn_goal(self, dice_values: List[int]) -> Category:
         """
         Chooses categories conservatively, favoring safe scoring options.
@@ -131,22 +153,17 @@ class CautiousBot(Player):
             A safe category to target.
         """
         available = self.scoreboard.get_available_categories()
-        counts = Counter(dice_values)
-
-        value_map = {
-            DiceValue.ONE.value: Category.ONES,
-            DiceValue.TWO.value: Category.TWOS,
-            DiceValue.THREE.value: Category.THREES,
-            DiceValue.FOUR.value: Category.FOURS,
-            DiceValue.FIVE.value: Category.FIVES,
-            DiceValue.SIX.value: Category.SIXES,
-        }
-
-        for value, count in counts.most_common():
-            if count >= CombinationThreshold.PAIR.value:
-                category = value_map[value]
-                if category in available:
-                    return category
+        tally = Scoreboard.count_faces(dice_values)
+        # distinct faces by descending count; the stable sort keeps the
+        # first-seen order on ties, like Counter.most_common
+        faces = sorted(dict.fromkeys(dice_values), key=tally.__getitem__, reverse=True)
+
+        for value in faces:
+            if tally[value] < CombinationThreshold.PAIR.value:
+                break
+            category = _VALUE_MAP[value]
+            if category in available:
+                return category
 
         for cat in Scoreboard.STAGE_1:
             if cat in available:
@@ -166,6 +183,8 @@ class CautiousBot(Player):
 class RandomBot(Player):
     """Bot that makes completely random decisions."""
 
+    __slots__ = ()
+
     def decide_turn_goal(self, dice_values: List[int]) -> Category:
         """
         Randomly selects an available category.
@@ -189,5 +208,4 @@ class RandomBot(Player):
             A random list of dice indices to reroll.
         """
         num_to_reroll = random.randint(0, len(dice_values))
-        indices = list(range(len(dice_values)))
-        return random.sample(indices, num_to_reroll)
+        return random.sample(range(len(dice_values)), num_to_reroll)
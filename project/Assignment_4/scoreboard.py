@@ -1,7 +1,10 @@
-from typing import List, Dict, Optional
-from collections import Counter
+from array import array
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Tuple
 from enum import Enum
 
+import numpy as np
+
 
 class Category(Enum):
     """All scoring categories in the game."""
@@ -71,9 +74,122 @@ class LargeStraight(Enum):
     STRAIGHT_2 = frozenset({2, 3, 4, 5, 6})
 
 
+# Plain int copies of the enum values read while scoring, so hot paths skip
+# the enum attribute lookups; the enums stay the public definitions
+_PAIR = CombinationThreshold.PAIR.value
+_THREE_OF_A_KIND = CombinationThreshold.THREE_OF_A_KIND.value
+_FOUR_OF_A_KIND = CombinationThreshold.FOUR_OF_A_KIND.value
+_FULL_HOUSE_THREE = CombinationThreshold.FULL_HOUSE_THREE.value
+_FULL_HOUSE_TWO = CombinationThreshold.FULL_HOUSE_TWO.value
+_POKER = CombinationThreshold.POKER.value
+_STAGE_ONE_BONUS = Bonus.STAGE_ONE_BONUS.value
+_POKER_BONUS = Bonus.POKER_BONUS.value
+_FIRST_THROW_MULTIPLIER = Bonus.FIRST_THROW_MULTIPLIER.value
+
+
+def _face_mask(tally: List[int]) -> int:
+    """Returns a bitmask with bit i set when at least one die shows face i."""
+    mask = 0
+    for face in range(1, 7):
+        if tally[face]:
+            mask |= 1 << face
+    return mask
+
+
+# Straights as face bitmasks, so a check is an integer compare instead of
+# building a set and walking the enum
+_SMALL_STRAIGHT_MASKS: Tuple[int, ...] = tuple(
+    sum(1 << face for face in s.value) for s in SmallStraight
+)
+_LARGE_STRAIGHT_MASKS: Tuple[int, ...] = tuple(
+    sum(1 << face for face in s.value) for s in LargeStraight
+)
+
+
+def _has_small_straight(tally: List[int]) -> bool:
+    """Checks whether the dice contain any small straight."""
+    mask = _face_mask(tally)
+    return any(mask & straight == straight for straight in _SMALL_STRAIGHT_MASKS)
+
+
+# Condition each stage two category checks on the face tally, looked up by
+# category instead of walking an if/elif chain on every scoring call
+_STAGE_TWO_CONDITIONS: Dict[Category, Callable[[List[int]], bool]] = {
+    Category.PAIR: lambda tally: max(tally) >= _PAIR,
+    Category.TWO_PAIRS: lambda tally: (
+        tally.count(_PAIR) >= _PAIR or _FOUR_OF_A_KIND in tally or _POKER in tally
+    ),
+    Category.THREE_OF_A_KIND: lambda tally: max(tally) >= _THREE_OF_A_KIND,
+    Category.FOUR_OF_A_KIND: lambda tally: max(tally) >= _FOUR_OF_A_KIND,
+    Category.SMALL_STRAIGHT: _has_small_straight,
+    Category.LARGE_STRAIGHT: lambda tally: _face_mask(tally) in _LARGE_STRAIGHT_MASKS,
+    Category.EVEN: lambda tally: not (tally[1] or tally[3] or tally[5]),
+    Category.ODD: lambda tally: not (tally[2] or tally[4] or tally[6]),
+    Category.FULL_HOUSE: lambda tally: (
+        _FULL_HOUSE_THREE in tally and _FULL_HOUSE_TWO in tally
+    ),
+    Category.POKER: lambda tally: _POKER in tally,
+    Category.CHANCE: lambda tally: True,
+}
+
+
+def _score_stage_two_tally(
+    category: Category, tally: List[int], total: int, first_throw: bool
+) -> int:
+    """Scores a stage two category from an already computed tally and dice sum."""
+    condition = _STAGE_TWO_CONDITIONS.get(category)
+    if condition is None or not condition(tally):
+        return 0
+
+    score = total
+    if first_throw and category != Category.CHANCE:
+        score *= _FIRST_THROW_MULTIPLIER
+    if category == Category.POKER:
+        score += _POKER_BONUS
+    return score
+
+
+# Vectorised counterparts of _STAGE_TWO_CONDITIONS, evaluated on an (N, 7)
+# tally matrix holding one row of face counts per roll
+_FACE_BITS = 1 << np.arange(7)
+_STAGE_TWO_BATCH_CONDITIONS: Dict[Category, Callable[[np.ndarray], np.ndarray]] = {
+    Category.PAIR: lambda tally: tally.max(axis=1) >= _PAIR,
+    Category.TWO_PAIRS: lambda tally: ((tally == _PAIR).sum(axis=1) >= _PAIR)
+    | ((tally == _FOUR_OF_A_KIND) | (tally == _POKER)).any(axis=1),
+    Category.THREE_OF_A_KIND: lambda tally: tally.max(axis=1) >= _THREE_OF_A_KIND,
+    Category.FOUR_OF_A_KIND: lambda tally: tally.max(axis=1) >= _FOUR_OF_A_KIND,
+    Category.SMALL_STRAIGHT: lambda tally: np.logical_or.reduce(
+        [
+            ((tally > 0) @ _FACE_BITS) & straight == straight
+            for straight in _SMALL_STRAIGHT_MASKS
+        ]
+    ),
+    Category.LARGE_STRAIGHT: lambda tally: np.isin(
+        (tally > 0) @ _FACE_BITS, _LARGE_STRAIGHT_MASKS
+    ),
+    Category.EVEN: lambda tally: tally[:, 1::2].sum(axis=1) == 0,
+    Category.ODD: lambda tally: tally[:, 2::2].sum(axis=1) == 0,
+    Category.FULL_HOUSE: lambda tally: (
+        (tally == _FULL_HOUSE_THREE).any(axis=1)
+        & (tally == _FULL_HOUSE_TWO).any(axis=1)
+    ),
+    Category.POKER: lambda tally: (tally == _POKER).any(axis=1),
+    Category.CHANCE: lambda tally: np.ones(len(tally), dtype=bool),
+}
+
+
 class Scoreboard:
     """Manages scoring for all categories in a Yahtzee game."""
 
+    __slots__ = (
+        "_values",
+        "_filled",
+        "_stage_one_sum",
+        "_stage_two_sum",
+        "_available_cache",
+        "_scores_cache",
+    )
+
     STAGE_1: List[Category] = [
         Category.ONES,
         Category.TWOS,
@@ -82,6 +198,15 @@ class Scoreboard:
         Category.FIVES,
         Category.SIXES,
     ]
+    # face counted by each stage one category
+    STAGE_ONE_TARGETS: Dict[Category, int] = {
+        Category.ONES: DiceValue.ONE.value,
+        Category.TWOS: DiceValue.TWO.value,
+        Category.THREES: DiceValue.THREE.value,
+        Category.FOURS: DiceValue.FOUR.value,
+        Category.FIVES: DiceValue.FIVE.value,
+        Category.SIXES: DiceValue.SIX.value,
+    }
     STAGE_2: List[Category] = [
         Category.PAIR,
         Category.TWO_PAIRS,
@@ -96,18 +221,59 @@ class Scoreboard:
         Category.CHANCE,
     ]
     CATEGORIES: List[Category] = STAGE_1 + STAGE_2
+    # position of each category in _values and bit in _filled
+    _INDEX: Dict[Category, int] = {c: i for i, c in enumerate(CATEGORIES)}
+    _ALL_FILLED: int = (1 << len(CATEGORIES)) - 1
+    # padded row labels for __str__, in CATEGORIES order
+    _LABELS: Tuple[str, ...] = tuple(f"{c.value:16}: " for c in CATEGORIES)
 
     def __init__(self) -> None:
         """Initializes an empty scoreboard with all categories unfilled."""
-        self.scores: Dict[Category, Optional[int]] = {c: None for c in self.CATEGORIES}
-
-    def get_available_categories(self) -> List[Category]:
+        self._values = array("i", [0] * len(self.CATEGORIES))
+        self._filled = 0
+        self._stage_one_sum = 0
+        self._stage_two_sum = 0
+        self._available_cache: Optional[Tuple[Category, ...]] = None
+        self._scores_cache: Optional[Mapping[Category, Optional[int]]] = None
+
+    def get_available_categories(self) -> Tuple[Category, ...]:
         """
         Returns all categories that haven't been filled yet.
+        The result is cached until the next category is filled.
+        Returns:
+            Tuple of unfilled categories.
+        """
+        if self._available_cache is None:
+            self._available_cache = tuple(
+                c for c, i in self._INDEX.items() if not self._filled >> i & 1
+            )
+        return self._available_cache
+
+    @property
+    def scores(self) -> Mapping[Category, Optional[int]]:
+        """
+        Returns a read-only view of every category's score, None for unfilled ones.
+        The view is cached until the next category is filled; fill categories
+        with fill_category.
+        """
+        if self._scores_cache is None:
+            self._scores_cache = MappingProxyType(
+                {c: self.get_score(c) for c in self.CATEGORIES}
+            )
+        return self._scores_cache
+
+    def get_score(self, category: Category) -> Optional[int]:
+        """
+        Returns the score filled in for a category.
+
+        Args:
+            category: The category to look up.
+
         Returns:
-            List of unfilled categories.
+            The category's score, or None if it hasn't been filled yet.
         """
-        return [c for c, v in self.scores.items() if v is None]
+        index = self._INDEX[category]
+        return self._values[index] if self._filled >> index & 1 else None
 
     def get_stage_one_subtotal(self) -> int:
         """
@@ -116,9 +282,7 @@ class Scoreboard:
         Returns:
             Total points from stage one categories.
         """
-        return sum(
-            v for c, v in self.scores.items() if c in self.STAGE_1 and v is not None
-        )
+        return self._stage_one_sum
 
     def is_complete(self) -> bool:
         """
@@ -127,7 +291,7 @@ class Scoreboard:
         Returns:
             True if scoreboard is complete, False otherwise.
         """
-        return all(v is not None for v in self.scores.values())
+        return self._filled == self._ALL_FILLED
 
     def get_total_score(self) -> int:
         """
@@ -136,12 +300,8 @@ class Scoreboard:
         Returns:
             Total score with stage one bonus if applicable.
         """
-        stage_one_total = self.get_stage_one_subtotal()
-        stage_two_total = sum(
-            v for c, v in self.scores.items() if c in self.STAGE_2 and v is not None
-        )
-        bonus = Bonus.STAGE_ONE_BONUS.value if stage_one_total >= 0 else 0
-        return stage_one_total + stage_two_total + bonus
+        bonus = _STAGE_ONE_BONUS if self._stage_one_sum >= 0 else 0
+        return self._stage_one_sum + self._stage_two_sum + bonus
 
     def fill_category(
         self, category: Category, dice_values: List[int], first_throw: bool = False
@@ -160,13 +320,24 @@ class Scoreboard:
         Raises:
             ValueError: If category is invalid or already filled.
         """
-        if category not in self.CATEGORIES:
-            raise ValueError(f"Unknown category: {category}")
-        if self.scores[category] is not None:
+        try:
+            index = self._INDEX[category]
+        except KeyError:
+            raise ValueError(f"Unknown category: {category}") from None
+        if self._filled >> index & 1:
             raise ValueError(f"Category '{category.value}' is already filled")
 
         score = Scoreboard.score_for_category(category, dice_values, first_throw)
-        self.scores[category] = score
+        self._values[index] = score
+        self._filled |= 1 << index
+        # stage totals are kept up to date here so reading them is O(1);
+        # stage one categories come first in CATEGORIES
+        if index < len(self.STAGE_1):
+            self._stage_one_sum += score
+        else:
+            self._stage_two_sum += score
+        self._available_cache = None
+        self._scores_cache = None
         return score
 
     @staticmethod
@@ -187,11 +358,27 @@ class Scoreboard:
         Raises:
             ValueError: If category is invalid.
         """
-        if category in Scoreboard.STAGE_1:
-            return Scoreboard.score_stage_one(category, dice_values)
-        elif category in Scoreboard.STAGE_2:
-            return Scoreboard.score_stage_two(category, dice_values, first_throw)
-        raise ValueError(f"Unknown category: {category}")
+        try:
+            scorer = _SCORERS[category]
+        except KeyError:
+            raise ValueError(f"Unknown category: {category}") from None
+        return scorer(category, dice_values, first_throw)
+
+    @staticmethod
+    def count_faces(dice_values: List[int]) -> List[int]:
+        """
+        Counts how many dice show each face.
+
+        Args:
+            dice_values: The dice values to count.
+
+        Returns:
+            A list of length 7 where index i holds the number of dice showing i.
+        """
+        tally = [0] * 7
+        for value in dice_values:
+            tally[value] += 1
+        return tally
 
     @staticmethod
     def score_stage_one(category: Category, dice_values: List[int]) -> int:
@@ -205,19 +392,9 @@ class Scoreboard:
         Returns:
             Score based on matching dice minus threshold.
         """
-        counts = Counter(dice_values)
-        target_map = {
-            Category.ONES: DiceValue.ONE.value,
-            Category.TWOS: DiceValue.TWO.value,
-            Category.THREES: DiceValue.THREE.value,
-            Category.FOURS: DiceValue.FOUR.value,
-            Category.FIVES: DiceValue.FIVE.value,
-            Category.SIXES: DiceValue.SIX.value,
-        }
-        target_value = target_map[category]
-        return (
-            counts.get(target_value, 0) - CombinationThreshold.THREE_OF_A_KIND.value
-        ) * target_value
+        tally = Scoreboard.count_faces(dice_values)
+        target_value = Scoreboard.STAGE_ONE_TARGETS[category]
+        return (tally[target_value] - _THREE_OF_A_KIND) * target_value
 
     @staticmethod
     def score_stage_two(
@@ -234,92 +411,110 @@ class Scoreboard:
         Returns:
             Score with applicable bonuses and multipliers.
         """
-        counts = Counter(dice_values)
-        total_sum = sum(dice_values)
-        score = 0
-        combination_met = False
-
-        if category == Category.PAIR:
-            if any(v >= CombinationThreshold.PAIR.value for v in counts.values()):
-                score = total_sum
-                combination_met = True
-        elif category == Category.TWO_PAIRS:
-            if (
-                list(counts.values()).count(CombinationThreshold.PAIR.value)
-                >= CombinationThreshold.PAIR.value
-                or CombinationThreshold.FOUR_OF_A_KIND.value in counts.values()
-                or CombinationThreshold.POKER.value in counts.values()
-            ):
-                score = total_sum
-                combination_met = True
-        elif category == Category.THREE_OF_A_KIND:
-            if any(
-                v >= CombinationThreshold.THREE_OF_A_KIND.value for v in counts.values()
-            ):
-                score = total_sum
-                combination_met = True
-        elif category == Category.FOUR_OF_A_KIND:
-            if any(
-                v >= CombinationThreshold.FOUR_OF_A_KIND.value for v in counts.values()
-            ):
-                score = total_sum
-                combination_met = True
-        elif category == Category.SMALL_STRAIGHT:
-            unique_dice = frozenset(dice_values)
-            if any(s.value.issubset(unique_dice) for s in SmallStraight):
-                score = total_sum
-                combination_met = True
-        elif category == Category.LARGE_STRAIGHT:
-            unique_dice = frozenset(dice_values)
-            if any(unique_dice == s.value for s in LargeStraight):
-                score = total_sum
-                combination_met = True
-        elif category == Category.EVEN:
-            if all(d % CombinationThreshold.PAIR.value == 0 for d in dice_values):
-                score = total_sum
-                combination_met = True
-        elif category == Category.ODD:
-            if all(d % CombinationThreshold.PAIR.value != 0 for d in dice_values):
-                score = total_sum
-                combination_met = True
-        elif category == Category.FULL_HOUSE:
-            if (
-                CombinationThreshold.FULL_HOUSE_THREE.value in counts.values()
-                and CombinationThreshold.FULL_HOUSE_TWO.value in counts.values()
-            ):
-                score = total_sum
-                combination_met = True
-        elif category == Category.POKER:
-            if CombinationThreshold.POKER.value in counts.values():
-                score = total_sum + Bonus.POKER_BONUS.value
-                combination_met = True
-        elif category == Category.CHANCE:
-            score = total_sum
-            combination_met = True
-
-        if not combination_met:
-            return 0
+        return _score_stage_two_tally(
+            category, Scoreboard.count_faces(dice_values), sum(dice_values), first_throw
+        )
+
+    @staticmethod
+    def score_all_categories(
+        dice_values: List[int],
+        first_throw: bool = False,
+        categories: Optional[Sequence[Category]] = None,
+    ) -> Dict[Category, int]:
+        """
+        Calculates the score of one roll for many categories at once.
+        The dice are counted and summed a single time for all categories.
+
+        Args:
+            dice_values: The dice values to score.
+            first_throw: Whether this was achieved on the first roll.
+            categories: Categories to score, all of them by default.
+
+        Returns:
+            Mapping from each category to its score, as score_for_category.
+        """
+        if categories is None:
+            categories = Scoreboard.CATEGORIES
+        tally = Scoreboard.count_faces(dice_values)
+        total = sum(dice_values)
+        scores = {}
+        for category in categories:
+            target_value = Scoreboard.STAGE_ONE_TARGETS.get(category)
+            if target_value is not None:
+                scores[category] = (
+                    tally[target_value] - _THREE_OF_A_KIND
+                ) * target_value
+            else:
+                scores[category] = _score_stage_two_tally(
+                    category, tally, total, first_throw
+                )
+        return scores
+
+    @staticmethod
+    def score_batch(
+        category: Category, rolls: np.ndarray, first_throw: bool = False
+    ) -> np.ndarray:
+        """
+        Calculates the score for a category over many rolls at once.
+
+        Args:
+            category: The category to score.
+            rolls: Integer array of shape (N, number of dice), one roll per row.
+            first_throw: Whether the rolls were achieved on the first roll.
+
+        Returns:
+            Integer array of N scores, matching score_for_category row by row.
+
+        Raises:
+            ValueError: If category is invalid.
+        """
+        rolls = np.asarray(rolls)
+        tally = (rolls[:, :, np.newaxis] == np.arange(7)).sum(axis=1)
+
+        if category in Scoreboard.STAGE_ONE_TARGETS:
+            target_value = Scoreboard.STAGE_ONE_TARGETS[category]
+            return (tally[:, target_value] - _THREE_OF_A_KIND) * target_value
+
+        condition = _STAGE_TWO_BATCH_CONDITIONS.get(category)
+        if condition is None:
+            raise ValueError(f"Unknown category: {category}")
+        score = rolls.sum(axis=1)
         if first_throw and category != Category.CHANCE:
-            if category == Category.POKER:
-                return (
-                    total_sum * Bonus.FIRST_THROW_MULTIPLIER.value
-                ) + Bonus.POKER_BONUS.value
-            return score * Bonus.FIRST_THROW_MULTIPLIER.value
-        return score
+            score *= _FIRST_THROW_MULTIPLIER
+        if category == Category.POKER:
+            score += _POKER_BONUS
+        return np.where(condition(tally), score, 0)
 
     def __str__(self) -> str:
         """Returns a formatted string representation of the scoreboard."""
-        lines = ["--- STAGE 1 ---"]
-        for cat in self.STAGE_1:
-            val = self.scores[cat]
-            lines.append(f"{cat.value:16}: {val if val is not None else '-'}")
-        lines.append(f"SUBTOTAL (S1): {self.get_stage_one_subtotal()}")
-        if self.get_stage_one_subtotal() >= 0:
-            lines.append(f"BONUS:           {Bonus.STAGE_ONE_BONUS.value}")
+        rows = [
+            label + (str(self._values[i]) if self._filled >> i & 1 else "-")
+            for i, label in enumerate(self._LABELS)
+        ]
+        stage_one = len(self.STAGE_1)
+        subtotal = self._stage_one_sum
+
+        lines = ["--- STAGE 1 ---", *rows[:stage_one]]
+        lines.append(f"SUBTOTAL (S1): {subtotal}")
+        if subtotal >= 0:
+            lines.append(f"BONUS:           {_STAGE_ONE_BONUS}")
         lines.append("\n--- STAGE 2 ---")
-        for cat in self.STAGE_2:
-            val = self.scores[cat]
-            lines.append(f"{cat.value:16}: {val if val is not None else '-'}")
+        lines.extend(rows[stage_one:])
         lines.append("--------------------")
         lines.append(f"TOTAL: {self.get_total_score()}")
         return "\n".join(lines)
+
+
+def _score_stage_one(
+    category: Category, dice_values: List[int], first_throw: bool = False
+) -> int:
+    """Adapts score_stage_one to the stage two signature; first_throw is unused."""
+    return Scoreboard.score_stage_one(category, dice_values)
+
+
+# Scorer for every category behind one signature, so score_for_category
+# dispatches with a single dict lookup instead of two list scans
+_SCORERS: Dict[Category, Callable[[Category, List[int], bool], int]] = {
+    **{c: _score_stage_one for c in Scoreboard.STAGE_1},
+    **{c: Scoreboard.score_stage_two for c in Scoreboard.STAGE_2},
+}
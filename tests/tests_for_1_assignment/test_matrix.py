@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 from project.Assignment_1.matrix_operation import (
     addition_matrices,
@@ -126,3 +127,19 @@ def test_transpose_vector_row():
     A = [[1.0, 2.0, 3.0]]
     expected = [[1.0], [2.0], [3.0]]
     assert transpose(A) == expected
+
+
+def test_operations_accept_ndarray():
+    """
+    Test matrix operations with numpy.ndarray operands.
+
+    Verifies the functions give the same results for arrays as for lists.
+
+    Test cases:
+    - Matrix 2x3 and Matrix 3x2 passed as float64 arrays.
+    """
+    A = np.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+    B = np.array([[7.0, 8.0], [9.0, 10.0], [11.0, 12.0]])
+    np.testing.assert_allclose(addition_matrices(A, A), 2 * A)
+    np.testing.assert_allclose(multiplication_matrices(A, B), A @ B)
+    np.testing.assert_allclose(transpose(A), A.T)
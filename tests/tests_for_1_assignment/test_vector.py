@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 from math import pi, sqrt, isclose
 from project.Assignment_1.vector_operation import (
@@ -161,6 +162,36 @@ def test_get_angle_45_degrees():
     assert get_angle_between_vectors(v1, v2) == pytest.approx(expected)
 
 
+def test_get_angle_parallel_rounding():
+    """
+    Test angle calculation for parallel vectors whose cosine rounds past 1.
+
+    Verifies the angle is 0 degrees instead of a math domain error.
+
+    Test cases:
+    - Vectors [1/3, 2/3, 0.7] and [1, 2, 2.1].
+    """
+    v1 = [1 / 3, 2 / 3, 0.7]
+    v2 = [3 * x for x in v1]
+    expected = 0.0
+    assert get_angle_between_vectors(v1, v2) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("scale", [1e100, 1e-90, 1e-160])
+def test_get_angle_extreme_magnitudes(scale):
+    """
+    Test angle calculation for very large and very small vectors.
+
+    Verifies the angle does not overflow or underflow.
+
+    Test cases:
+    - Vectors [s, 0] and [s, s] for s = 1e100, 1e-90 and 1e-160.
+    """
+    v1 = [scale, 0.0]
+    v2 = [scale, scale]
+    assert get_angle_between_vectors(v1, v2) == pytest.approx(45.0, rel=1e-3)
+
+
 # ----------------------------------------------------------------------------------
 
 
@@ -190,3 +221,19 @@ def test_get_angle_with_zero_vector():
     v2 = [0.0, 0.0]
     with pytest.raises(ZeroDivisionError) as excinfo:
         get_angle_between_vectors(v1, v2)
+
+
+def test_vector_operations_accept_ndarray():
+    """
+    Test vector operations with numpy.ndarray operands.
+
+    Verifies the functions give the same results for arrays as for lists.
+
+    Test cases:
+    - Vectors [3, 4] and [4, -3] passed as float64 arrays.
+    """
+    a = np.array([3.0, 4.0])
+    b = np.array([4.0, -3.0])
+    assert scalar_multiplication_of_vectors(a, b) == 0.0
+    assert find_length_of_vectors(a) == 5.0
+    assert get_angle_between_vectors(a, b) == pytest.approx(90.0)
@@ -1,10 +1,11 @@
 import pytest
 from functools import reduce
-import random
 
 from project.Assignment_2.generator import (
+    seed,
     generate_data,
     pipeline,
+    numpy_pipeline,
     aggregator,
     create_op_adapter,
 )
@@ -12,7 +13,7 @@ from project.Assignment_2.generator import (
 
 @pytest.fixture(autouse=True)
 def fixed_random_seed():
-    random.seed(42)
+    seed(42)
 
 
 def test_lazy():
@@ -39,6 +40,13 @@ def test_generate_data():
     assert all(1 <= x <= 5 for x in data)
 
 
+def test_generate_data_seeded():
+    seed(7)
+    first = list(generate_data(20, 1, 100))
+    seed(7)
+    assert list(generate_data(20, 1, 100)) == first
+
+
 def test_create_op_map():
     adapter = create_op_adapter(map, lambda x: x * 2)
     data = [1, 2, 3]
@@ -88,6 +96,16 @@ def test_pipeline_single_operation():
     assert result == [2, 4, 6]
 
 
+def test_pipeline_chained_map_filter():
+    map_inc = create_op_adapter(map, lambda x: x + 1)
+    filter_even = create_op_adapter(filter, lambda x: x % 2 == 0)
+    map_square = create_op_adapter(map, lambda x: x * x)
+    enum = create_op_adapter(enumerate)
+    data = [1, 2, 3, 4, 5]
+    result = list(pipeline(data, map_inc, filter_even, map_square, enum))
+    assert result == [(0, 4), (1, 16), (2, 36)]
+
+
 def test_pipeline_with_reduce():
     reduce_sum = create_op_adapter(reduce, lambda a, b: a + b)
     data = [1, 2, 3, 4]
@@ -95,6 +113,26 @@ def test_pipeline_with_reduce():
     assert result == [10]
 
 
+def test_numpy_pipeline():
+    data = range(10)
+    result = list(
+        numpy_pipeline(data, lambda a: a * a, lambda a: a[a > 10], batch_size=4)
+    )
+    assert result == [16.0, 25.0, 36.0, 49.0, 64.0, 81.0]
+
+
+def test_numpy_pipeline_generated_data():
+    gen = numpy_pipeline(generate_data(5, 1, 10), lambda a: a + 1)
+    assert all(2 <= x <= 11 for x in gen)
+    assert list(numpy_pipeline([], lambda a: a + 1)) == []
+
+
+@pytest.mark.parametrize("batch_size", [0, -1])
+def test_numpy_pipeline_invalid_batch_size(batch_size):
+    with pytest.raises(ValueError):
+        numpy_pipeline([1, 2, 3], batch_size=batch_size)
+
+
 def test_aggregator_list():
     data = [1, 2, 3]
     result = aggregator(data)
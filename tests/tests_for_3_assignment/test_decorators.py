@@ -127,6 +127,22 @@ def test_isolated_nested():
     assert original_list == [[1], [2]]
 
 
+def test_isolated_keeps_deepcopy_hooks():
+    class Shared:
+        def __deepcopy__(self, memo):
+            return self
+
+    @smart_args
+    def my_func(*, data=Isolated()):
+        return data
+
+    shared = Shared()
+    original_list = [shared, [1]]
+    result = my_func(data=original_list)
+    assert result[0] is shared
+    assert result[1] is not original_list[1]
+
+
 def test_isolated_requires_argument():
     @smart_args
     def my_func(*, data=Isolated()):
@@ -210,6 +226,13 @@ def test_curry_multiple_args_first_stage():
         curried_f(1, 2, 3)
 
 
+def test_curry_stage_reuse():
+    curried_f = curry_explicit(f_sum, 3)
+    stage1 = curried_f(1)
+    assert stage1(2)(3) == 6
+    assert stage1(10)(20) == 31
+
+
 def test_curry_multiple_args_middle_stage():
     curried_f = curry_explicit(f_sum, 3)
     stage1 = curried_f(1)
@@ -1,5 +1,6 @@
+import numpy as np
 import pytest
-from project.Assignment_4.dice import Dice
+from project.Assignment_4.dice import Dice, roll_values, seed
 from project.Assignment_4.player import AggressiveBot, CautiousBot
 from project.Assignment_4.scoreboard import Scoreboard, Category
 from project.Assignment_4.Game import Turn, GameState, YahtzeeGame
@@ -15,6 +16,23 @@ class TestDice:
                 break
         assert 1 <= dice.value <= 6
 
+    def test_roll_values(self):
+        values = roll_values(100)
+        assert len(values) == 100
+        assert ((values >= 1) & (values <= 6)).all()
+
+    def test_seed_repeats_rolls(self):
+        seed(42)
+        first = roll_values(20).tolist()
+        seed(42)
+        assert roll_values(20).tolist() == first
+
+    def test_seed_repeats_dice(self):
+        seed(3)
+        first = [Dice().value for _ in range(10)]
+        seed(3)
+        assert [Dice().value for _ in range(10)] == first
+
 
 class TestScoreboard:
     def test_fill_category(self):
@@ -29,6 +47,51 @@ class TestScoreboard:
         with pytest.raises(ValueError):
             sb.fill_category(Category.ONES, [1, 1, 1, 1, 1])
 
+    def test_scores_view(self):
+        sb = Scoreboard()
+        sb.fill_category(Category.ONES, [1, 1, 1, 2, 3])
+        assert sb.scores[Category.ONES] == 0
+        assert sb.scores[Category.CHANCE] is None
+        assert sb.get_score(Category.ONES) == 0
+        assert sb.get_score(Category.CHANCE) is None
+        with pytest.raises(TypeError):
+            sb.scores[Category.CHANCE] = 5
+        sb.fill_category(Category.CHANCE, [1, 2, 3, 4, 5])
+        assert sb.scores[Category.CHANCE] == 15
+        assert not sb.is_complete()
+
+    def test_total_score_updates(self):
+        sb = Scoreboard()
+        empty_total = sb.get_total_score()
+        sb.fill_category(Category.CHANCE, [1, 2, 3, 4, 5])
+        assert sb.get_total_score() == empty_total + 15
+        sb.fill_category(Category.SIXES, [6, 6, 6, 6, 1])
+        assert sb.get_total_score() == empty_total + 15 + 6
+
+    def test_score_all_categories(self):
+        dice = [2, 2, 3, 3, 3]
+        scores = Scoreboard.score_all_categories(dice, True)
+        assert set(scores) == set(Scoreboard.CATEGORIES)
+        for category, score in scores.items():
+            assert score == Scoreboard.score_for_category(category, dice, True)
+
+    def test_score_batch(self):
+        rolls = np.array([[1, 2, 3, 4, 5], [6, 6, 6, 6, 6], [2, 2, 3, 3, 3]])
+        for category in Category:
+            expected = [
+                Scoreboard.score_for_category(category, roll, True)
+                for roll in rolls.tolist()
+            ]
+            assert Scoreboard.score_batch(category, rolls, True).tolist() == expected
+
+    def test_score_batch_six_dice(self):
+        rolls = np.array([[2, 2, 2, 2, 2, 2], [1, 1, 1, 1, 3, 3], [1, 2, 3, 4, 5, 6]])
+        for category in Category:
+            expected = [
+                Scoreboard.score_for_category(category, roll) for roll in rolls.tolist()
+            ]
+            assert Scoreboard.score_batch(category, rolls).tolist() == expected
+
     def test_bonus(self):
         sb = Scoreboard()
         score = sb.fill_category(Category.POKER, [6, 6, 6, 6, 6])
@@ -42,6 +105,13 @@ class TestTurn:
         turn.roll_dice()
         assert turn.roll_count == 1
 
+    def test_seeded_rolls_repeat(self):
+        player = AggressiveBot("Bot")
+        seed(7)
+        first = Turn(player).roll_dice()
+        seed(7)
+        assert Turn(player).roll_dice() == first
+
     def test_three_rolls(self):
         player = AggressiveBot("Bot")
         turn = Turn(player)
@@ -51,6 +121,16 @@ class TestTurn:
         with pytest.raises(ValueError):
             turn.roll_dice()
 
+    def test_reset(self):
+        player = AggressiveBot("Bot")
+        turn = Turn(player)
+        turn.roll_dice()
+        turn.roll_dice()
+        turn.reset()
+        assert turn.roll_count == 0
+        assert turn.get_dice_values() == []
+        assert len(turn.roll_dice()) == 5
+
 
 class TestGameState:
     def test_advance_player(self):
@@ -69,6 +149,17 @@ class TestGameState:
 
 
 class TestYahtzeeGame:
+    def test_winner_determination(self):
+        players = [AggressiveBot("Bot1"), CautiousBot("Bot2"), AggressiveBot("Bot3")]
+        game = YahtzeeGame(players, verbose=False)
+        players[1].scoreboard.fill_category(Category.CHANCE, [6, 6, 6, 6, 5])
+        game._determine_winner()
+        assert game.winner is players[1]
+
+        players[2].scoreboard.fill_category(Category.CHANCE, [6, 6, 6, 6, 5])
+        game._determine_winner()
+        assert game.winner is None
+
     def test_full_game(self):
         players = [AggressiveBot("Bot1"), CautiousBot("Bot2")]
         game = YahtzeeGame(players, verbose=False)